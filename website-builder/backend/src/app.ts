@@ -29,7 +29,7 @@ import generationRoutes from './routes/generations';
 import webhookRoutes from './routes/webhooks';
 
 // Import swagger configuration
-import { swaggerSpec } from './config/swagger';
+import { getSwaggerSpec } from './config/swagger';
 
 const app = express();
 
@@ -55,18 +55,19 @@ app.use(helmet({
 }));
 
 // CORS configuration
+// Read once: the allowed origins come from the environment and do not change at runtime
+const allowedOrigins = new Set(process.env.ALLOWED_ORIGINS?.split(',') || [
+  'http://localhost:3000',
+  'http://localhost:5173',
+  'http://localhost:4173'
+]);
+
 const corsOptions = {
   origin: function (origin: string | undefined, callback: (err: Error | null, allow?: boolean) => void) {
-    const allowedOrigins = process.env.ALLOWED_ORIGINS?.split(',') || [
-      'http://localhost:3000',
-      'http://localhost:5173',
-      'http://localhost:4173'
-    ];
-    
     // Allow requests with no origin (mobile apps, etc.)
     if (!origin) return callback(null, true);
     
-    if (allowedOrigins.includes(origin)) {
+    if (allowedOrigins.has(origin)) {
       callback(null, true);
     } else {
       callback(new Error('Not allowed by CORS'));
@@ -146,6 +147,18 @@ const speedLimiter = slowDown({
 app.use(speedLimiter);
 
 // File upload configuration
+// Allow common file types
+const allowedUploadTypes = new Set([
+  'image/jpeg',
+  'image/png',
+  'image/gif',
+  'image/webp',
+  'image/svg+xml',
+  'application/pdf',
+  'text/plain',
+  'application/json'
+]);
+
 const upload = multer({
   dest: process.env.UPLOAD_DIR || './uploads',
   limits: {
@@ -154,19 +167,7 @@ const upload = multer({
     fields: 20
   },
   fileFilter: (req, file, cb) => {
-    // Allow common file types
-    const allowedTypes = [
-      'image/jpeg',
-      'image/png',
-      'image/gif',
-      'image/webp',
-      'image/svg+xml',
-      'application/pdf',
-      'text/plain',
-      'application/json'
-    ];
-    
-    if (allowedTypes.includes(file.mimetype)) {
+    if (allowedUploadTypes.has(file.mimetype)) {
       cb(null, true);
     } else {
       cb(new Error(`File type ${file.mimetype} not allowed`));
@@ -227,6 +228,8 @@ app.get('/health', (req, res) => {
 
 // Swagger documentation setup
 if (process.env.NODE_ENV === 'development') {
+  const swaggerSpec = getSwaggerSpec();
+  
   app.use('/api/docs', swaggerUi.serve, swaggerUi.setup(swaggerSpec, {
     customCss: '.swagger-ui .topbar { display: none }',
     customSiteTitle: 'Website Builder API Documentation',
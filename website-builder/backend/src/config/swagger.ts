@@ -349,5 +349,15 @@ const options: swaggerJSDoc.Options = {
   ]
 };
 
-export const swaggerSpec = swaggerJSDoc(options);
-export default swaggerSpec;
+let swaggerSpec: object | undefined;
+
+// Parsing the route JSDoc is expensive and the spec is only served in
+// development, so it is built on first use rather than at import
+export const getSwaggerSpec = (): object => {
+  if (!swaggerSpec) {
+    swaggerSpec = swaggerJSDoc(options);
+  }
+  return swaggerSpec;
+};
+
+export default getSwaggerSpec;
@@ -59,6 +59,20 @@ export class RateLimitError extends AppError {
   }
 }
 
+// NODE_ENV does not change at runtime, so resolve the environment flags once.
+// Resolved lazily because dotenv runs after module imports are evaluated.
+let envFlags: { isDevelopment: boolean; isProduction: boolean } | undefined;
+
+function getEnvFlags(): { isDevelopment: boolean; isProduction: boolean } {
+  if (!envFlags) {
+    envFlags = {
+      isDevelopment: process.env.NODE_ENV === 'development',
+      isProduction: process.env.NODE_ENV === 'production',
+    };
+  }
+  return envFlags;
+}
+
 // Error classification function
 function classifyError(error: any): {
   statusCode: number;
@@ -196,7 +210,7 @@ function classifyError(error: any): {
   return {
     statusCode: 500,
     code: 'INTERNAL_ERROR',
-    message: process.env.NODE_ENV === 'production' 
+    message: getEnvFlags().isProduction 
       ? 'An unexpected error occurred' 
       : error.message || 'Unknown error',
   };
@@ -219,7 +233,7 @@ function logError(error: any, req: Request): void {
     },
   };
 
-  if (process.env.NODE_ENV === 'development') {
+  if (getEnvFlags().isDevelopment) {
     console.error('🚨 Error occurred:', JSON.stringify(errorInfo, null, 2));
   } else {
     console.error('🚨 Error occurred:', JSON.stringify(errorInfo));
@@ -249,7 +263,7 @@ export const errorHandler = (
       code,
       message,
       ...(details && { details }),
-      ...(process.env.NODE_ENV === 'development' && {
+      ...(getEnvFlags().isDevelopment && {
         stack: error.stack,
         originalError: error.message,
       }),
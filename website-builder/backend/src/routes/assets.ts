@@ -25,6 +25,9 @@ const router = Router();
 // Configure multer for file uploads
 const uploadDir = process.env.UPLOAD_DIR || path.join(process.cwd(), 'uploads', 'temp');
 
+// Root directory stored asset paths are relative to (matches AssetService)
+const assetRootDir = process.env.UPLOAD_DIR || path.join(process.cwd(), 'uploads');
+
 // Ensure upload directory exists
 fs.ensureDirSync(uploadDir);
 
@@ -837,8 +840,7 @@ router.get(
       return;
     }
 
-    const uploadDir = process.env.UPLOAD_DIR || path.join(process.cwd(), 'uploads');
-    const filePath = path.join(uploadDir, asset.filePath);
+    const filePath = path.join(assetRootDir, asset.filePath);
 
     if (!await fs.pathExists(filePath)) {
       res.status(404).json({
@@ -940,8 +942,7 @@ router.get(
       return;
     }
 
-    const uploadDir = process.env.UPLOAD_DIR || path.join(process.cwd(), 'uploads');
-    const filePath = path.join(uploadDir, asset.filePath);
+    const filePath = path.join(assetRootDir, asset.filePath);
 
     if (!await fs.pathExists(filePath)) {
       res.status(404).json({
@@ -640,20 +640,15 @@ export class ReferenceDataService {
         }
       ];
 
-      // Filter by business type if provided
-      let filteredSuggestions = suggestions;
-      if (businessType) {
-        filteredSuggestions = suggestions.filter(s => 
-          s.businessTypes.includes(businessType) || s.category === businessType
-        );
+      if (!businessType && !contentType) {
+        return suggestions;
       }
 
-      // Filter by content type if provided
-      if (contentType) {
-        filteredSuggestions = filteredSuggestions.filter(s => s.type === contentType);
-      }
-
-      return filteredSuggestions;
+      // Filter by business type and content type in a single pass
+      return suggestions.filter(s =>
+        (!businessType || s.category === businessType || s.businessTypes.includes(businessType)) &&
+        (!contentType || s.type === contentType)
+      );
     } catch (error) {
       throw new AppError('Failed to fetch content suggestions', 500, 'DATABASE_ERROR');
     }
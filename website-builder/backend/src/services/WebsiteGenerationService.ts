@@ -16,6 +16,7 @@ import archiver from 'archiver';
 import { v4 as uuidv4 } from 'uuid';
 import { exec } from 'child_process';
 import { promisify } from 'util';
+import { performance } from 'perf_hooks';
 
 const execAsync = promisify(exec);
 
@@ -376,27 +377,27 @@ export class WebsiteGenerationService {
     project: Project & { wizardSteps: any[] },
     options: GenerationOptions
   ): Promise<void> {
-    const startTime = Date.now();
+    const startTime = performance.now();
 
     try {
       // Step 1: Generate AI Content
       await this.updateGenerationStatus(generationId, SiteGenerationStatus.GENERATING_CONTENT);
-      const aiStartTime = Date.now();
+      const aiStartTime = performance.now();
       const content = await this.generateAIContent(project, options);
-      const aiProcessingTime = Date.now() - aiStartTime;
+      const aiProcessingTime = Math.round(performance.now() - aiStartTime);
 
       // Step 2: Build Hugo Site
       await this.updateGenerationStatus(generationId, SiteGenerationStatus.BUILDING_SITE);
-      const buildStartTime = Date.now();
+      const buildStartTime = performance.now();
       const siteData = await this.buildHugoSite(generationId, project, content, options);
-      const hugoBuildTime = Date.now() - buildStartTime;
+      const hugoBuildTime = Math.round(performance.now() - buildStartTime);
 
       // Step 3: Package Site
       await this.updateGenerationStatus(generationId, SiteGenerationStatus.PACKAGING);
       const packagedSite = await this.packageSite(generationId, siteData);
 
       // Step 4: Complete
-      const totalTime = Date.now() - startTime;
+      const totalTime = Math.round(performance.now() - startTime);
       await this.updateGenerationStatus(generationId, SiteGenerationStatus.COMPLETED, {
         siteUrl: packagedSite.fileName,
         fileSize: packagedSite.fileSize,
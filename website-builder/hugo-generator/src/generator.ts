@@ -6,8 +6,7 @@ import compression from 'compression';
 import { config } from 'dotenv';
 import * as path from 'path';
 
-import generationRoutes from './routes/generation';
-import { HugoSiteBuilder } from './services/HugoSiteBuilder';
+import generationRoutes, { hugoBuilder } from './routes/generation';
 import { FileManager } from './utils/FileManager';
 
 // Load environment variables
@@ -16,6 +15,15 @@ config();
 const app = express();
 const PORT = process.env.PORT || 3003;
 
+// Fixed part of the 404 response body, built once instead of per request
+const AVAILABLE_ENDPOINTS: readonly string[] = Object.freeze([
+  'GET /',
+  'GET /health',
+  'POST /api/generation/generate',
+  'GET /api/generation/download/:filename',
+  'GET /api/generation/themes'
+]);
+
 // Middleware
 app.use(helmet());
 app.use(cors());
@@ -47,7 +55,6 @@ app.use('/packages', express.static(path.join(process.cwd(), 'packages')));
 // Health check endpoint
 app.get('/health', async (req: Request, res: Response) => {
   try {
-    const hugoBuilder = new HugoSiteBuilder();
     const health = await hugoBuilder.healthCheck();
     
     res.json({
@@ -101,13 +108,7 @@ app.use('*', (req: Request, res: Response) => {
     success: false,
     error: 'Endpoint not found',
     path: req.originalUrl,
-    availableEndpoints: [
-      'GET /',
-      'GET /health',
-      'POST /api/generation/generate',
-      'GET /api/generation/download/:filename',
-      'GET /api/generation/themes'
-    ]
+    availableEndpoints: AVAILABLE_ENDPOINTS
   });
 });
 
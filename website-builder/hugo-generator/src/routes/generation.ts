@@ -4,7 +4,8 @@ import { HugoSiteBuilder } from '../services/HugoSiteBuilder';
 import { FileManager } from '../utils/FileManager';
 
 const router = express.Router();
-const hugoBuilder = new HugoSiteBuilder();
+// Shared with the top-level /health endpoint so the service runs a single builder
+export const hugoBuilder = new HugoSiteBuilder();
 const fileManager = new FileManager();
 
 // Generate website
@@ -47,11 +48,13 @@ router.get('/health', async (req: Request, res: Response): Promise<void> => {
 });
 
 // Download generated site
-router.get('/download/:filename', (req: Request, res: Response): void => {
-  try {    const filename = req.params.filename;
+router.get('/download/:filename', async (req: Request, res: Response): Promise<void> => {
+  try {
+    const filename = req.params.filename;
     const filePath = path.join(process.cwd(), 'packages', filename);
     
-    if (!require('fs').existsSync(filePath)) {
+    // Async check so a slow disk does not stall the event loop
+    if (!await fileManager.exists(filePath)) {
       res.status(404).json({ error: 'File not found' });
       return;
     }
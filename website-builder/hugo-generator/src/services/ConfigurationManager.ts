@@ -386,7 +386,6 @@ export class ConfigurationManager {
     if (wizardData.themeConfig?.colorScheme) {
       const customCSS = this.generateCustomCSS(wizardData.themeConfig.colorScheme);
       const cssPath = path.join(assetsDir, 'css', 'extended', 'custom.css');
-      await this.fileManager.ensureDir(path.dirname(cssPath));
       await this.fileManager.writeFile(cssPath, customCSS);
     }
   }
@@ -30,61 +30,62 @@ export class ContentGenerator {
       
       console.log('Starting content generation...');
       
+      // Each page writes to its own file, so generate them concurrently;
+      // results are collected in page order
+      const pageTasks: Promise<string | string[]>[] = [];
+      
       // Generate homepage content
       if (generatedContent.homepage) {
-        const homepageFile = await this.generateHomepage(
+        pageTasks.push(this.generateHomepage(
           siteDir, 
           generatedContent.homepage, 
           seoData?.homepage,
           wizardData
-        );
-        createdFiles.push(homepageFile);
+        ));
       }
       
       // Generate about page
       if (generatedContent.about) {
-        const aboutFile = await this.generateAboutPage(
+        pageTasks.push(this.generateAboutPage(
           siteDir,
           generatedContent.about,
           seoData?.about,
           wizardData
-        );
-        createdFiles.push(aboutFile);
+        ));
       }
       
       // Generate services content
       if (generatedContent.services && wizardData.selectedServices) {
-        const serviceFiles = await this.generateServicesContent(
+        pageTasks.push(this.generateServicesContent(
           siteDir,
           generatedContent.services,
           seoData?.services,
           wizardData.selectedServices,
           structure
-        );
-        createdFiles.push(...serviceFiles);
+        ));
       }
       
       // Generate contact page
       if (generatedContent.contact) {
-        const contactFile = await this.generateContactPage(
+        pageTasks.push(this.generateContactPage(
           siteDir,
           generatedContent.contact,
           seoData?.contact,
           wizardData
-        );
-        createdFiles.push(contactFile);
+        ));
       }
       
       // Generate blog posts if applicable
       if (generatedContent.blog_posts && this.hasBlogStructure(structure)) {
-        const blogFiles = await this.generateBlogPosts(
+        pageTasks.push(this.generateBlogPosts(
           siteDir,
           generatedContent.blog_posts,
           wizardData
-        );
-        createdFiles.push(...blogFiles);
+        ));
       }
       
+      createdFiles.push(...(await Promise.all(pageTasks)).flat());
+      
       console.log(`Content generation completed. Created ${createdFiles.length} files.`);
       
       return {
@@ -369,7 +370,6 @@ export class ContentGenerator {
     const fullContent = this.buildMarkdownFile(frontMatter, content);
     const filePath = path.join(siteDir, 'content', 'services', '_index.md');
     
-    await this.fileManager.ensureDir(path.dirname(filePath));
     await this.fileManager.writeFile(filePath, fullContent);
     
     return filePath;
@@ -426,7 +426,6 @@ export class ContentGenerator {
     const fullContent = this.buildMarkdownFile(frontMatter, content);
     const filePath = path.join(siteDir, 'content', 'services', `${serviceSlug}.md`);
     
-    await this.fileManager.ensureDir(path.dirname(filePath));
     await this.fileManager.writeFile(filePath, fullContent);
     
     return filePath;
@@ -445,10 +444,11 @@ export class ContentGenerator {
       const blogIndexPath = await this.generateBlogIndex(siteDir);
       createdFiles.push(blogIndexPath);
       
-      // Create individual blog posts
+      // Create individual blog posts, dated relative to a single timestamp
+      const publishedAt = Date.now();
       for (let i = 0; i < blogPosts.length; i++) {
         const post = blogPosts[i];
-        const postPath = await this.generateBlogPost(siteDir, post, i + 1);
+        const postPath = await this.generateBlogPost(siteDir, post, i + 1, publishedAt);
         createdFiles.push(postPath);
       }
       
@@ -473,7 +473,6 @@ export class ContentGenerator {
     const fullContent = this.buildMarkdownFile(frontMatter, content);
     const filePath = path.join(siteDir, 'content', 'posts', '_index.md');
     
-    await this.fileManager.ensureDir(path.dirname(filePath));
     await this.fileManager.writeFile(filePath, fullContent);
     
     return filePath;
@@ -482,10 +481,11 @@ export class ContentGenerator {
   private async generateBlogPost(
     siteDir: string,
     postContent: any,
-    postNumber: number
+    postNumber: number,
+    publishedAt: number
   ): Promise<string> {
     const postSlug = this.slugify(postContent.title || `post-${postNumber}`);
-    const postDate = new Date();
+    const postDate = new Date(publishedAt);
     postDate.setDate(postDate.getDate() - (postNumber * 7)); // Space posts a week apart
     
     const frontMatter = {
@@ -519,7 +519,6 @@ Thank you for reading! Stay tuned for more updates and insights.
     const fullContent = this.buildMarkdownFile(frontMatter, content);
     const filePath = path.join(siteDir, 'content', 'posts', `${postSlug}.md`);
     
-    await this.fileManager.ensureDir(path.dirname(filePath));
     await this.fileManager.writeFile(filePath, fullContent);
     
     return filePath;
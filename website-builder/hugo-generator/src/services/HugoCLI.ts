@@ -1,5 +1,6 @@
 import { exec, spawn } from 'child_process';
 import { promisify } from 'util';
+import { performance } from 'perf_hooks';
 import * as path from 'path';
 import { FileManager } from '../utils/FileManager';
 import * as yaml from 'js-yaml';
@@ -7,6 +8,7 @@ import * as yaml from 'js-yaml';
 export class HugoCLI {
   private execAsync = promisify(exec);
   private hugoVersion: string | null = null;
+  private versionCheck: Promise<boolean> | null = null;
   private fileManager: FileManager;
   
   constructor() {
@@ -16,8 +18,18 @@ export class HugoCLI {
   
   // Hugo CLI validation and info
   async validateHugoInstallation(): Promise<boolean> {
+    // Concurrent callers share a single `hugo version` run
+    if (!this.versionCheck) {
+      this.versionCheck = this.detectHugoVersion().finally(() => {
+        this.versionCheck = null;
+      });
+    }
+    return this.versionCheck;
+  }
+  
+  private async detectHugoVersion(): Promise<boolean> {
     try {
-      const { stdout } = await this.execAsync('hugo version');
+      const { stdout } = await this.execAsync('hugo version', { timeout: 10000 });
       this.hugoVersion = stdout.trim();
       console.log(`Hugo CLI detected: ${this.hugoVersion}`);
       return true;
@@ -83,7 +95,6 @@ export class HugoCLI {
     } catch (error: any) {
       // If hugo new fails, create the file manually
       const fullPath = path.join(siteDir, 'content', contentPath);
-      await this.fileManager.ensureDir(path.dirname(fullPath));
       
       const defaultContent = this.generateDefaultContent(frontMatter);
       await this.fileManager.writeFile(fullPath, defaultContent);
@@ -105,7 +116,7 @@ export class HugoCLI {
     errors?: string[];
   }> {
     try {
-      const startTime = Date.now();
+      const startTime = performance.now();
       
       // Build Hugo command
       let command = 'hugo';
@@ -121,7 +132,7 @@ export class HugoCLI {
         timeout: 120000 // 2 minutes timeout
       });
       
-      const buildTime = Date.now() - startTime;
+      const buildTime = Math.round(performance.now() - startTime);
       const outputDir = path.join(siteDir, 'public');
       
       // Check for errors in stderr
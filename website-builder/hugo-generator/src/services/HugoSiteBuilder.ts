@@ -1,11 +1,21 @@
 import * as path from 'path';
+import { createWriteStream } from 'fs';
+import { performance } from 'perf_hooks';
 import * as yaml from 'js-yaml';
+import archiver from 'archiver';
 import { HugoCLI } from './HugoCLI';
 import { ThemeInstaller } from './ThemeInstaller';
 import { ContentGenerator } from './ContentGenerator';
 import { ConfigurationManager } from './ConfigurationManager';
 import { FileManager } from '../utils/FileManager';
 
+// Every site is built with the same Hugo flags
+const PRODUCTION_BUILD_OPTIONS = Object.freeze({
+  minify: true,
+  cleanDestination: true,
+  environment: 'production'
+});
+
 export class HugoSiteBuilder {
   private hugoCLI: HugoCLI;
   private themeInstaller: ThemeInstaller;
@@ -39,7 +49,7 @@ export class HugoSiteBuilder {
     errors: string[];
     metadata: any;
   }> {
-    const startTime = Date.now();
+    const startTime = performance.now();
     const buildLog: string[] = [];
     const errors: string[] = [];
     let siteDir = '';
@@ -111,7 +121,7 @@ export class HugoSiteBuilder {
       const packageResult = await this.packageSite(siteDir, request.projectId);
       buildLog.push(`Site packaged: ${packageResult.downloadUrl}`);
       
-      const totalTime = Date.now() - startTime;
+      const totalTime = Math.round(performance.now() - startTime);
       buildLog.push(`[${new Date().toISOString()}] Site generation completed in ${totalTime}ms`);
       
       return {
@@ -130,7 +140,7 @@ export class HugoSiteBuilder {
       };
       
     } catch (error: any) {
-      const totalTime = Date.now() - startTime;
+      const totalTime = Math.round(performance.now() - startTime);
       errors.push(error.message);
       buildLog.push(`[${new Date().toISOString()}] Site generation failed: ${error.message}`);
       
@@ -182,7 +192,7 @@ export class HugoSiteBuilder {
     try {
       // Get theme configuration from popular themes
       const popularThemes = this.themeInstaller.getPopularThemes();
-      const selectedTheme = popularThemes.find(theme => theme.id === themeConfig.id) ||
+      const selectedTheme = this.themeInstaller.getThemeById(themeConfig.id) ||
                            popularThemes[0]; // Default to first theme
       
       // Install theme
@@ -191,7 +201,7 @@ export class HugoSiteBuilder {
       if (!installResult.success) {
         // Try fallback theme if primary fails
         console.warn(`Primary theme failed, trying fallback...`);
-        const fallbackTheme = popularThemes.find(theme => theme.id === 'ananke') ||
+        const fallbackTheme = this.themeInstaller.getThemeById('ananke') ||
                               popularThemes[0];
         
         return await this.themeInstaller.installTheme(siteDir, fallbackTheme);
@@ -268,11 +278,7 @@ Sitemap: https://example.com/sitemap.xml`;
   }
     private async buildHugoSite(siteDir: string): Promise<any> {
     try {
-      const buildResult = await this.hugoCLI.buildSite(siteDir, {
-        minify: true,
-        cleanDestination: true,
-        environment: 'production'
-      });
+      const buildResult = await this.hugoCLI.buildSite(siteDir, PRODUCTION_BUILD_OPTIONS);
       
       // Validate build output
       const publicDir = path.join(siteDir, 'public');
@@ -302,8 +308,7 @@ Sitemap: https://example.com/sitemap.xml`;
       const zipPath = path.join(packageDir, filename);
       
       // Create ZIP file using archiver
-      const archiver = require('archiver');
-      const output = require('fs').createWriteStream(zipPath);
+      const output = createWriteStream(zipPath);
       const archive = archiver('zip', { zlib: { level: 9 } });
       
       archive.pipe(output);
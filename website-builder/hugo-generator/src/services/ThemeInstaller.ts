@@ -1,9 +1,85 @@
 import { exec } from 'child_process';
+import { createWriteStream } from 'fs';
+import { pipeline } from 'stream/promises';
 import { promisify } from 'util';
 import * as path from 'path';
 import axios from 'axios';
+import * as yauzl from 'yauzl';
 import { FileManager } from '../utils/FileManager';
 
+export interface HugoThemeConfig {
+  id: string;
+  name: string;
+  displayName: string;
+  githubUrl: string;
+  category: string;
+  suitableFor: readonly string[];
+}
+
+// Frozen (entries and their suitableFor lists) so callers sharing the list cannot mutate it
+const POPULAR_THEMES: ReadonlyArray<Readonly<HugoThemeConfig>> = Object.freeze([
+  {
+    id: 'papermod',
+    name: 'PaperMod',
+    displayName: 'PaperMod - Modern Blog Theme',
+    githubUrl: 'https://github.com/adityatelange/hugo-PaperMod.git',
+    category: 'blog',
+    suitableFor: ['blog', 'personal', 'business']
+  },
+  {
+    id: 'ananke',
+    name: 'ananke',
+    displayName: 'Ananke - Versatile Business Theme',
+    githubUrl: 'https://github.com/theNewDynamic/gohugo-theme-ananke.git',
+    category: 'business',
+    suitableFor: ['business', 'portfolio', 'blog']
+  },
+  {
+    id: 'academic',
+    name: 'academic',
+    displayName: 'Academic - Portfolio Theme',
+    githubUrl: 'https://github.com/wowchemy/starter-hugo-academic.git',
+    category: 'portfolio',
+    suitableFor: ['portfolio', 'academic', 'personal']
+  },
+  {
+    id: 'mainroad',
+    name: 'Mainroad',
+    displayName: 'Mainroad - Magazine Style',
+    githubUrl: 'https://github.com/Vimux/Mainroad.git',
+    category: 'blog',
+    suitableFor: ['blog', 'news', 'magazine']
+  },
+  {
+    id: 'clarity',
+    name: 'hugo-clarity',
+    displayName: 'Clarity - Tech Blog Theme',
+    githubUrl: 'https://github.com/chipzoller/hugo-clarity.git',
+    category: 'tech',
+    suitableFor: ['blog', 'tech', 'personal']
+  },
+  {
+    id: 'terminal',
+    name: 'terminal',
+    displayName: 'Terminal - Developer Theme',
+    githubUrl: 'https://github.com/panr/hugo-theme-terminal.git',
+    category: 'tech',
+    suitableFor: ['developer', 'tech', 'personal']
+  }
+].map(theme => Object.freeze({ ...theme, suitableFor: Object.freeze(theme.suitableFor) })));
+
+// Files or directories whose presence marks a usable theme install
+const THEME_MARKER_FILES: readonly string[] = Object.freeze([
+  'theme.toml',
+  'theme.yaml',
+  'config.toml',
+  'config.yaml',
+  'layouts'
+]);
+
+// Theme lookup by id, built once at module load
+const THEMES_BY_ID = new Map(POPULAR_THEMES.map(theme => [theme.id, theme] as const));
+
 export class ThemeInstaller {
   private execAsync = promisify(exec);
   private tempDir: string;
@@ -85,13 +161,12 @@ export class ThemeInstaller {
     try {
       // Convert GitHub URL to ZIP download URL
       const zipUrl = githubUrl.replace(/\.git$/, '') + '/archive/refs/heads/main.zip';
-        // Download ZIP file
-      const response = await axios.get(zipUrl, { responseType: 'arraybuffer' });
-      
-      // Extract ZIP to temporary location
       const tempZipPath = path.join(this.tempDir, `theme-${Date.now()}.zip`);
       await this.fileManager.ensureDir(path.dirname(tempZipPath));
-      await this.fileManager.writeBinaryFile(tempZipPath, response.data);
+      
+      // Stream the ZIP straight to disk instead of buffering the whole archive
+      const response = await axios.get(zipUrl, { responseType: 'stream' });
+      await pipeline(response.data, createWriteStream(tempZipPath));
       
       // Extract ZIP
       await this.extractZip(tempZipPath, themePath);
@@ -106,8 +181,6 @@ export class ThemeInstaller {
   
   private async extractZip(zipPath: string, extractPath: string): Promise<void> {
     return new Promise((resolve, reject) => {
-      const yauzl = require('yauzl');
-      
       yauzl.open(zipPath, { lazyEntries: true }, (err: any, zipfile: any) => {
         if (err) return reject(err);
         
@@ -126,7 +199,7 @@ export class ThemeInstaller {
                 if (err) return reject(err);
                   const outputPath = path.join(extractPath, relativePath);
                 this.fileManager.ensureDir(path.dirname(outputPath)).then(() => {
-                  const writeStream = require('fs').createWriteStream(outputPath);
+                  const writeStream = createWriteStream(outputPath);
                   readStream.pipe(writeStream);
                   writeStream.on('close', () => zipfile.readEntry());
                   writeStream.on('error', reject);
@@ -146,28 +219,13 @@ export class ThemeInstaller {
   
   private async validateThemeInstallation(themePath: string): Promise<boolean> {
     try {
-      // Check for required theme files
-      const requiredFiles = [
-        'theme.toml',
-        'theme.yaml',
-        'config.toml',
-        'config.yaml',
-        'layouts'
-      ];
-        for (const file of requiredFiles) {
-        const filePath = path.join(themePath, file);
-        if (await this.fileManager.exists(filePath)) {
-          return true; // At least one required file exists
-        }
-      }
-      
-      // Check for layouts directory
-      const layoutsDir = path.join(themePath, 'layouts');
-      if (await this.fileManager.exists(layoutsDir)) {
-        return true;
-      }
+      // A theme is valid if any of its marker files exists; check them in one
+      // concurrent pass (this list already covers the layouts directory)
+      const found = await Promise.all(
+        THEME_MARKER_FILES.map(file => this.fileManager.exists(path.join(themePath, file)))
+      );
       
-      return false;
+      return found.some(Boolean);
       
     } catch (error: any) {
       return false;
@@ -175,63 +233,12 @@ export class ThemeInstaller {
   }
   
   // Get popular Hugo themes configuration
-  getPopularThemes(): Array<{
-    id: string;
-    name: string;
-    displayName: string;
-    githubUrl: string;
-    category: string;
-    suitableFor: string[];
-  }> {
-    return [
-      {
-        id: 'papermod',
-        name: 'PaperMod',
-        displayName: 'PaperMod - Modern Blog Theme',
-        githubUrl: 'https://github.com/adityatelange/hugo-PaperMod.git',
-        category: 'blog',
-        suitableFor: ['blog', 'personal', 'business']
-      },
-      {
-        id: 'ananke',
-        name: 'ananke',
-        displayName: 'Ananke - Versatile Business Theme',
-        githubUrl: 'https://github.com/theNewDynamic/gohugo-theme-ananke.git',
-        category: 'business',
-        suitableFor: ['business', 'portfolio', 'blog']
-      },
-      {
-        id: 'academic',
-        name: 'academic',
-        displayName: 'Academic - Portfolio Theme',
-        githubUrl: 'https://github.com/wowchemy/starter-hugo-academic.git',
-        category: 'portfolio',
-        suitableFor: ['portfolio', 'academic', 'personal']
-      },
-      {
-        id: 'mainroad',
-        name: 'Mainroad',
-        displayName: 'Mainroad - Magazine Style',
-        githubUrl: 'https://github.com/Vimux/Mainroad.git',
-        category: 'blog',
-        suitableFor: ['blog', 'news', 'magazine']
-      },
-      {
-        id: 'clarity',
-        name: 'hugo-clarity',
-        displayName: 'Clarity - Tech Blog Theme',
-        githubUrl: 'https://github.com/chipzoller/hugo-clarity.git',
-        category: 'tech',
-        suitableFor: ['blog', 'tech', 'personal']
-      },
-      {
-        id: 'terminal',
-        name: 'terminal',
-        displayName: 'Terminal - Developer Theme',
-        githubUrl: 'https://github.com/panr/hugo-theme-terminal.git',
-        category: 'tech',
-        suitableFor: ['developer', 'tech', 'personal']
-      }
-    ];
+  getPopularThemes(): ReadonlyArray<Readonly<HugoThemeConfig>> {
+    return POPULAR_THEMES;
+  }
+  
+  // Look up a popular theme by id
+  getThemeById(id: string): Readonly<HugoThemeConfig> | undefined {
+    return THEMES_BY_ID.get(id);
   }
 }